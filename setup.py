@@ -1,11 +1,41 @@
 #!/usr/bin/env python
 """
 uModbus is a pure Python implementation of the Modbus protocol with support
-for Python 2.7, 3.4, 3.5, 3.6, 3.7 and 3.8.
+for Python 3.4, 3.5, 3.6, 3.7 and 3.8.
 
 """
 import os
+from distutils.errors import CCompilerError, DistutilsExecError, \
+    DistutilsPlatformError
 from setuptools import setup
+from setuptools.command.build_ext import build_ext
+
+try:
+    # The package is pure Python. When Cython is available a compiled
+    # extension with the response parsing hot paths is built as well, the
+    # pure Python implementations are always kept as fallback. Any failure,
+    # like an sdist missing the .pyx file, means no extension.
+    from Cython.Build import cythonize
+    ext_modules = cythonize(['umodbus/_fastparse.pyx'])
+except Exception:
+    ext_modules = []
+
+
+class optional_build_ext(build_ext):
+    """ Skip the extension instead of failing the install when no working
+    C compiler is around, the pure Python fallback keeps the package usable.
+    """
+    def run(self):
+        try:
+            build_ext.run(self)
+        except DistutilsPlatformError:
+            pass
+
+    def build_extension(self, ext):
+        try:
+            build_ext.build_extension(self, ext)
+        except (CCompilerError, DistutilsExecError, DistutilsPlatformError):
+            pass
 
 cwd = os.path.dirname(os.path.abspath(__name__))
 
@@ -29,12 +59,13 @@ setup(name='uModbus',
       install_requires=[
           'pyserial~=3.4',
       ],
+      ext_modules=ext_modules,
+      cmdclass={'build_ext': optional_build_ext},
       classifiers=[
           'Development Status :: 6 - Mature',
           'Intended Audience :: Developers',
           'License :: OSI Approved :: Mozilla Public License 2.0 (MPL 2.0)',
           'Operating System :: OS Independent',
-          'Programming Language :: Python :: 2.7',
           'Programming Language :: Python :: 3.4',
           'Programming Language :: Python :: 3.5',
           'Programming Language :: Python :: 3.6',
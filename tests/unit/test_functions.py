@@ -7,6 +7,7 @@ try:
 except ImportError:
     from mock import MagicMock, call
 
+from umodbus import conf, functions
 from umodbus.route import Map
 from umodbus.exceptions import (IllegalFunctionError, IllegalDataAddressError,
                                 IllegalDataValueError,
@@ -19,7 +20,8 @@ from umodbus.functions import (create_function_from_response_pdu,
                                ReadDiscreteInputs, ReadHoldingRegisters,
                                ReadInputRegisters, WriteSingleCoil,
                                WriteSingleRegister, WriteMultipleCoils,
-                               WriteMultipleRegisters)
+                               WriteMultipleRegisters, _fastparse,
+                               _unpack_bits, _unpack_bits_nb)
 
 
 @pytest.fixture
@@ -99,6 +101,26 @@ def route_map():
     return Map()
 
 
+@pytest.fixture(params=['compiled', 'numpy', 'pure'])
+def unpack_tier(request, monkeypatch):
+    """ Force one of the parsing tiers, skipping tiers that aren't
+    available. Tests using this fixture run once per tier.
+    """
+    if request.param == 'compiled':
+        if functions._fastparse is None:
+            pytest.skip('Cython extension is not built.')
+    elif request.param == 'numpy':
+        if functions.np is None:
+            pytest.skip('NumPy is not installed.')
+        monkeypatch.setattr(functions, '_fastparse', None)
+        monkeypatch.setattr(functions, '_unpack_bits_nb', None)
+    else:
+        monkeypatch.setattr(functions, '_fastparse', None)
+        monkeypatch.setattr(functions, 'np', None)
+
+    return request.param
+
+
 @pytest.mark.parametrize('pdu,cls', [
     (b'\x01\x00d\x00\x03', ReadCoils),
     (b'\x02\x00d\x00\x03', ReadDiscreteInputs),
@@ -143,6 +165,82 @@ def test_create_function_from_request_pdu_raising_illegal_function_error():
         create_function_from_request_pdu(b'\x00')
 
 
+@pytest.mark.parametrize('quantity', [1, 3, 8, 11, 16])
+def test_unpack_bits(quantity):
+    """ Bits must be expanded LSB first, also for quantities that aren't a
+    multiple of 8.
+    """
+    resp_pdu = b'\x01\x02\xa5\x0f'
+    expected = [1, 0, 1, 0, 0, 1, 0, 1, 1, 1, 1, 1, 0, 0, 0, 0]
+
+    assert _unpack_bits(resp_pdu, 2, quantity) == expected[:quantity]
+
+
+def test_unpack_bits_with_short_payload():
+    """ A quantity larger than the payload must yield only the available
+    bits instead of reading past the payload.
+    """
+    assert _unpack_bits(b'\x01\x01\x06', 1, 2000) == [0, 1, 1, 0, 0, 0, 0, 0]
+
+
+@pytest.mark.skipif(_fastparse is None,
+                    reason='Cython extension is not built.')
+@pytest.mark.parametrize('quantity', [1, 3, 8, 11, 16])
+def test_fastparse_unpack_bits(quantity):
+    expected = [1, 0, 1, 0, 0, 1, 0, 1, 1, 1, 1, 1, 0, 0, 0, 0]
+
+    assert _fastparse.unpack_bits(b'\xa5\x0f', quantity) == \
+        expected[:quantity]
+
+
+@pytest.mark.skipif(_fastparse is None,
+                    reason='Cython extension is not built.')
+def test_fastparse_unpack_bits_with_short_payload():
+    assert _fastparse.unpack_bits(b'\x06', 2000) == [0, 1, 1, 0, 0, 0, 0, 0]
+
+
+@pytest.mark.skipif(_fastparse is None,
+                    reason='Cython extension is not built.')
+def test_fastparse_unpack_registers():
+    assert _fastparse.unpack_registers(b'\x05\x39\x00\x11', 2) == [1337, 17]
+
+
+@pytest.mark.skipif(_fastparse is None,
+                    reason='Cython extension is not built.')
+def test_fastparse_unpack_registers_signed():
+    assert _fastparse.unpack_registers(b'\xff\xfb\x00\x11', 2, True) == \
+        [-5, 17]
+
+
+@pytest.mark.skipif(_fastparse is None,
+                    reason='Cython extension is not built.')
+def test_fastparse_unpack_registers_with_short_payload():
+    """ A quantity larger than the payload must not read past the payload. """
+    assert _fastparse.unpack_registers(b'\x00', 125) == []
+
+
+@pytest.mark.skipif(_unpack_bits_nb is None,
+                    reason='Numba and NumPy are not installed.')
+@pytest.mark.parametrize('quantity', [1, 3, 8, 11, 16])
+def test_unpack_bits_nb(quantity):
+    import numpy as np
+
+    expected = [1, 0, 1, 0, 0, 1, 0, 1, 1, 1, 1, 1, 0, 0, 0, 0]
+    bytes_ = np.frombuffer(b'\xa5\x0f', dtype=np.uint8)
+
+    assert _unpack_bits_nb(bytes_, quantity).tolist() == expected[:quantity]
+
+
+@pytest.mark.skipif(_unpack_bits_nb is None,
+                    reason='Numba and NumPy are not installed.')
+def test_unpack_bits_nb_with_short_payload():
+    import numpy as np
+
+    bytes_ = np.frombuffer(b'\x06', dtype=np.uint8)
+
+    assert _unpack_bits_nb(bytes_, 2000).tolist() == [0, 1, 1, 0, 0, 0, 0, 0]
+
+
 def test_read_coils_class_attributes():
     assert ReadCoils.function_code == 1
     assert ReadCoils.max_quantity == 2000
@@ -166,6 +264,18 @@ def test_read_coils_response_pdu(read_coils):
     assert instance.data == [0, 1, 1]
 
 
+def test_read_coils_with_truncated_response_pdu(unpack_tier, read_coils):
+    """ Every parsing tier must expand only the bits actually present when
+    the byte count overstates the payload.
+    """
+    read_coils.quantity = 16
+
+    instance = ReadCoils.create_from_response_pdu(b'\x01\x04\x06',
+                                                  read_coils.request_pdu)
+
+    assert instance.data == [0, 1, 1, 0, 0, 0, 0, 0]
+
+
 def test_read_discrete_inputs_class_attributes():
     assert ReadDiscreteInputs.function_code == 2
     assert ReadDiscreteInputs.max_quantity == 2000
@@ -215,6 +325,48 @@ def test_read_holding_registers_response_pdu(read_holding_registers):
     assert instance.data == [1337, 17, 21, 18]
 
 
+def test_read_holding_registers_with_truncated_response_pdu(
+        unpack_tier, read_holding_registers):
+    """ Every parsing tier must return only the whole registers present in
+    a truncated response instead of raising or reading past the payload.
+    """
+    req_pdu = read_holding_registers.request_pdu
+
+    instance = \
+        ReadHoldingRegisters.create_from_response_pdu(b'\x03\x08\x05\x39\x00\x11', req_pdu)  # NOQA
+    assert instance.data == [1337, 17]
+
+    instance = ReadHoldingRegisters.create_from_response_pdu(b'\x03\x00',
+                                                             req_pdu)
+    assert instance.data == []
+
+
+def test_read_input_registers_with_truncated_response_pdu(
+        unpack_tier, read_input_registers):
+    """ Every parsing tier must return only the whole registers present in
+    a truncated response instead of raising or reading past the payload.
+    """
+    instance = ReadInputRegisters.create_from_response_pdu(
+        b'\x04\x04\x05\x39', read_input_registers.request_pdu)
+
+    assert instance.data == [1337]
+
+
+def test_read_holding_registers_signed_response_pdu(read_holding_registers):
+    """ Register values must be parsed as signed when so configured. """
+    conf.SIGNED_VALUES = True
+
+    try:
+        response_pdu = \
+            read_holding_registers.create_response_pdu([-1337, 17, -21, 18])
+        instance = ReadHoldingRegisters.create_from_response_pdu(
+            response_pdu, read_holding_registers.request_pdu)
+
+        assert instance.data == [-1337, 17, -21, 18]
+    finally:
+        conf.SIGNED_VALUES = False
+
+
 def test_read_input_registers_class_attributes():
     assert ReadInputRegisters.function_code == 4
     assert ReadInputRegisters.max_quantity == 125
@@ -0,0 +1,61 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+""" Optional C implementations of the response PDU parsing hot paths.
+
+This module is only built when Cython is available, see setup.py. The pure
+Python implementations in :mod:`umodbus.functions` are always kept as
+fallback so the package keeps working, on PyPy for example, without a
+compile step.
+"""
+
+
+cpdef list unpack_bits(const unsigned char[::1] payload, Py_ssize_t quantity):
+    """ Return list with status of bits packed in payload of response PDU.
+
+    The LSB of the first byte is the status of the first bit.
+
+    :param payload: Payload of response PDU, starting at the first data byte.
+    :param quantity: Number of bits to unpack.
+    :return: List with 0's and/or 1's.
+    """
+    cdef Py_ssize_t i
+    cdef Py_ssize_t available = payload.shape[0] * 8
+
+    if quantity > available:
+        quantity = available
+
+    cdef list data = [0] * quantity
+
+    for i in range(quantity):
+        data[i] = (payload[i >> 3] >> (i & 7)) & 1
+
+    return data
+
+
+cpdef list unpack_registers(const unsigned char[::1] payload,
+                            Py_ssize_t quantity, bint signed=False):
+    """ Return list with values of 16 bit big-endian registers packed in
+    payload of response PDU.
+
+    :param payload: Payload of response PDU, starting at the first data byte.
+    :param quantity: Number of registers to unpack.
+    :param signed: Whether values are signed, default False.
+    :return: List with register values.
+    """
+    cdef Py_ssize_t i
+    cdef int value
+    cdef Py_ssize_t available = payload.shape[0] // 2
+
+    if quantity > available:
+        quantity = available
+
+    cdef list data = [0] * quantity
+
+    for i in range(quantity):
+        value = (payload[2 * i] << 8) | payload[2 * i + 1]
+
+        if signed and value >= 0x8000:
+            value -= 0x10000
+
+        data[i] = value
+
+    return data
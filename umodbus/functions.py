@@ -71,6 +71,48 @@ try:
 except ImportError:
     pass
 
+try:
+    # NumPy is not required, but when it is available the expansion of coil
+    # bytes to a list of bits is done with a single vectorized call instead
+    # of a Python loop over every bit.
+    import numpy as np
+
+    # unpackbits only accepts the bitorder argument since NumPy 1.17. Treat
+    # older versions like NumPy isn't installed at all, instead of raising
+    # TypeError on every coil read.
+    np.unpackbits(np.zeros(1, dtype=np.uint8), bitorder='little')
+except (ImportError, TypeError):
+    np = None
+
+try:
+    # Compiled variants of the response parsing hot paths. The extension is
+    # only built when Cython is available at install time, see setup.py.
+    from umodbus import _fastparse
+except ImportError:
+    _fastparse = None
+
+try:
+    # Numba is not required either. When both Numba and NumPy are installed
+    # the coil bit expansion below is compiled to native code on first use.
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None and np is not None:
+    @njit(cache=True)
+    def _unpack_bits_nb(bytes_, quantity):
+        if quantity > bytes_.shape[0] * 8:
+            quantity = bytes_.shape[0] * 8
+
+        bits = np.empty(quantity, dtype=np.uint8)
+
+        for i in range(quantity):
+            bits[i] = (bytes_[i >> 3] >> (i & 7)) & 1
+
+        return bits
+else:
+    _unpack_bits_nb = None
+
 from umodbus import conf, log
 from umodbus.exceptions import (error_code_to_exception_map,
                                 IllegalDataValueError, IllegalFunctionError,
@@ -95,6 +137,11 @@ WRITE_FILE_RECORD = 21
 READ_WRITE_MULTIPLE_REGISTERS = 23
 READ_FIFO_QUEUE = 24
 
+# All read requests and the write single coil request share the same 5 byte
+# layout. Packing and unpacking through a precompiled Struct skips the
+# format string parsing struct.pack and struct.unpack do on every call.
+_request_pdu_struct = struct.Struct('>BHH')
+
 # Diagnostic functions, only available when using serial line.
 READ_EXCEPTION_STATUS = 7
 DIAGNOSTICS = 8
@@ -103,6 +150,62 @@ GET_COM_EVENT_LOG = 12
 REPORT_SERVER_ID = 17
 
 
+# The quantity setters reject a value with the same message every time, so
+# the messages are built once instead of being formatted for each rejected
+# assignment. The exceptions themselves are constructed at raise time:
+# raising a shared instance would mutate its __traceback__ across raises.
+_illegal_bit_quantity_message = \
+    'Quantity field of request must be a value between 1 and 2000.'
+_illegal_register_quantity_message = \
+    'Quantity field of request must be a value between 1 and 125.'
+
+# Maps a byte to its 8 status bits, LSB first. Lets the pure Python fallback
+# of _unpack_bits expand a byte with a single table index instead of
+# arithmetic per bit.
+_bit_table = [bytes((value >> k) & 1 for k in range(8))
+              for value in range(256)]
+
+
+def _unpack_bits(resp_pdu, byte_count, quantity):
+    """ Return list with status of bits packed in payload of response PDU.
+
+    The LSB of the first payload byte is the status of the first bit. When
+    quantity is not a multiple of 8 the padding bits in the last byte are
+    discarded.
+
+    :param resp_pdu: Byte array with response PDU.
+    :param byte_count: Number of payload bytes.
+    :param quantity: Number of bits to unpack.
+    :return: List with 0's and/or 1's.
+    """
+    # The byte count is server controlled and may overstate the payload of a
+    # truncated response. Clamp it so every tier expands exactly the bytes
+    # that are present.
+    byte_count = min(byte_count, len(resp_pdu) - 2)
+
+    if _fastparse is not None:
+        return _fastparse.unpack_bits(resp_pdu[2:2 + byte_count], quantity)
+
+    if np is not None:
+        # Expand all payload bytes to bits in a single vectorized call.
+        bytes_ = np.frombuffer(resp_pdu, dtype=np.uint8, offset=2,
+                               count=byte_count)
+
+        if _unpack_bits_nb is not None:
+            bits = _unpack_bits_nb(bytes_, quantity)
+        else:
+            bits = np.unpackbits(bytes_, bitorder='little')
+
+        return bits[:quantity].tolist()
+
+    data = bytearray()
+
+    for value in resp_pdu[2:2 + byte_count]:
+        data.extend(_bit_table[value])
+
+    return list(data[:quantity])
+
+
 def pdu_to_function_code_or_raise_error(resp_pdu):
     """ Parse response PDU and return of :class:`ModbusFunction` or
     raise error.
@@ -111,10 +214,15 @@ def pdu_to_function_code_or_raise_error(resp_pdu):
     :return: Subclass of :class:`ModbusFunction` matching the response.
     :raises ModbusError: When response contains error code.
     """
-    function_code = struct.unpack('>B', resp_pdu[0:1])[0]
-
-    if function_code not in function_code_to_function_map.keys():
-        error_code = struct.unpack('>B', resp_pdu[1:2])[0]
+    function_code = resp_pdu[0]
+
+    # A server signals an error by setting the MSB of the function code in
+    # its response, see MODBUS Application Protocol Specification V1.1b3,
+    # chapter 7. Responses with an unknown function code are treated as
+    # exception responses as well.
+    if function_code & 0x80 or \
+            _function_code_to_function_table[function_code] is None:
+        error_code = resp_pdu[1]
         raise error_code_to_exception_map[error_code]
 
     return function_code
@@ -130,14 +238,12 @@ def create_function_from_response_pdu(resp_pdu, req_pdu=None):
     :return: Number or list with response data.
     """
     function_code = pdu_to_function_code_or_raise_error(resp_pdu)
-    function = function_code_to_function_map[function_code]
+    parser, accepts_req_pdu = _response_pdu_parser_table[function_code]
 
-    if req_pdu is not None and \
-        'req_pdu' in getfullargspec(function.create_from_response_pdu).args:  # NOQA
+    if req_pdu is not None and accepts_req_pdu:
+        return parser(resp_pdu, req_pdu)
 
-        return function.create_from_response_pdu(resp_pdu, req_pdu)
-
-    return function.create_from_response_pdu(resp_pdu)
+    return parser(resp_pdu)
 
 
 @memoize
@@ -166,6 +272,8 @@ def expected_response_pdu_size_from_request_pdu(pdu):
 
 
 class ModbusFunction(object):
+    __slots__ = ()
+
     function_code = None
 
 
@@ -243,9 +351,12 @@ class ReadCoils(ModbusFunction):
     max_quantity = 2000
     format_character = 'B'
 
-    data = None
-    starting_address = None
-    _quantity = None
+    __slots__ = ('data', 'starting_address', '_quantity')
+
+    def __init__(self):
+        self.data = None
+        self.starting_address = None
+        self._quantity = None
 
     @property
     def quantity(self):
@@ -258,12 +369,10 @@ class ReadCoils(ModbusFunction):
         :param value: Quantity.
         :raises: IllegalDataValueError.
         """
-        if not (1 <= value <= 2000):
-            raise IllegalDataValueError('Quantify field of request must be a '
-                                        'value between 0 and '
-                                        '{0}.'.format(2000))
-
-        self._quantity = value
+        if 1 <= value <= 2000:
+            self._quantity = value
+        else:
+            raise IllegalDataValueError(_illegal_bit_quantity_message)
 
     @property
     def request_pdu(self):
@@ -275,8 +384,8 @@ class ReadCoils(ModbusFunction):
             # TODO Raise proper exception.
             raise Exception
 
-        return struct.pack('>BHH', self.function_code, self.starting_address,
-                           self.quantity)
+        return _request_pdu_struct.pack(self.function_code,
+                                        self.starting_address, self._quantity)
 
     @classmethod
     def create_from_request_pdu(cls, pdu):
@@ -285,7 +394,7 @@ class ReadCoils(ModbusFunction):
         :param pdu: A request PDU.
         :return: Instance of this class.
         """
-        _, starting_address, quantity = struct.unpack('>BHH', pdu)
+        _, starting_address, quantity = _request_pdu_struct.unpack(pdu)
 
         instance = cls()
         instance.starting_address = starting_address
@@ -335,25 +444,13 @@ class ReadCoils(ModbusFunction):
         :return: Instance of :class:`ReadCoils`.
         """
         read_coils = cls()
-        read_coils.quantity = struct.unpack('>H', req_pdu[-2:])[0]
-        byte_count = struct.unpack('>B', resp_pdu[1:2])[0]
-
-        fmt = '>' + ('B' * byte_count)
-        bytes_ = struct.unpack(fmt, resp_pdu[2:])
-
-        data = list()
-
-        for i, value in enumerate(bytes_):
-            padding = 8 if (read_coils.quantity - (8 * i)) // 8 > 0 \
-                else read_coils.quantity % 8
-
-            fmt = '{{0:0{padding}b}}'.format(padding=padding)
+        # The quantity comes from the already validated request, assigning
+        # _quantity directly skips a second run of the setter's range check.
+        read_coils._quantity = int.from_bytes(req_pdu[-2:], 'big')
 
-            # Create binary representation of integer, convert it to a list
-            # and reverse the list.
-            data = data + [int(i) for i in fmt.format(value)][::-1]
+        read_coils.data = _unpack_bits(resp_pdu, resp_pdu[1],
+                                       read_coils.quantity)
 
-        read_coils.data = data
         return read_coils
 
     def execute(self, slave_id, route_map):
@@ -451,9 +548,12 @@ class ReadDiscreteInputs(ModbusFunction):
     max_quantity = 2000
     format_character = 'B'
 
-    data = None
-    starting_address = None
-    _quantity = None
+    __slots__ = ('data', 'starting_address', '_quantity')
+
+    def __init__(self):
+        self.data = None
+        self.starting_address = None
+        self._quantity = None
 
     @property
     def quantity(self):
@@ -466,12 +566,10 @@ class ReadDiscreteInputs(ModbusFunction):
         :param value: Quantity.
         :raises: IllegalDataValueError.
         """
-        if not (1 <= value <= 2000):
-            raise IllegalDataValueError('Quantify field of request must be a '
-                                        'value between 0 and '
-                                        '{0}.'.format(2000))
-
-        self._quantity = value
+        if 1 <= value <= 2000:
+            self._quantity = value
+        else:
+            raise IllegalDataValueError(_illegal_bit_quantity_message)
 
     @property
     def request_pdu(self):
@@ -483,8 +581,8 @@ class ReadDiscreteInputs(ModbusFunction):
             # TODO Raise proper exception.
             raise Exception
 
-        return struct.pack('>BHH', self.function_code, self.starting_address,
-                           self.quantity)
+        return _request_pdu_struct.pack(self.function_code,
+                                        self.starting_address, self._quantity)
 
     @classmethod
     def create_from_request_pdu(cls, pdu):
@@ -493,7 +591,7 @@ class ReadDiscreteInputs(ModbusFunction):
         :param pdu: A request PDU.
         :return: Instance of this class.
         """
-        _, starting_address, quantity = struct.unpack('>BHH', pdu)
+        _, starting_address, quantity = _request_pdu_struct.unpack(pdu)
 
         instance = cls()
         instance.starting_address = starting_address
@@ -543,25 +641,13 @@ class ReadDiscreteInputs(ModbusFunction):
         :return: Instance of :class:`ReadDiscreteInputs`.
         """
         read_discrete_inputs = cls()
-        read_discrete_inputs.quantity = struct.unpack('>H', req_pdu[-2:])[0]
-        byte_count = struct.unpack('>B', resp_pdu[1:2])[0]
-
-        fmt = '>' + ('B' * byte_count)
-        bytes_ = struct.unpack(fmt, resp_pdu[2:])
+        # The quantity comes from the already validated request, assigning
+        # _quantity directly skips a second run of the setter's range check.
+        read_discrete_inputs._quantity = int.from_bytes(req_pdu[-2:], 'big')
 
-        data = list()
+        read_discrete_inputs.data = _unpack_bits(
+            resp_pdu, resp_pdu[1], read_discrete_inputs.quantity)
 
-        for i, value in enumerate(bytes_):
-            padding = 8 if (read_discrete_inputs.quantity - (8 * i)) // 8 > 0 \
-                else read_discrete_inputs.quantity % 8
-
-            fmt = '{{0:0{padding}b}}'.format(padding=padding)
-
-            # Create binary representation of integer, convert it to a list
-            # and reverse the list.
-            data = data + [int(i) for i in fmt.format(value)][::-1]
-
-        read_discrete_inputs.data = data
         return read_discrete_inputs
 
     def execute(self, slave_id, route_map):
@@ -649,9 +735,13 @@ class ReadHoldingRegisters(ModbusFunction):
     function_code = READ_HOLDING_REGISTERS
     max_quantity = 0x007D
 
-    data = None
-    starting_address = None
-    _quantity = None
+    __slots__ = ('byte_count', 'data', 'starting_address', '_quantity')
+
+    def __init__(self):
+        self.byte_count = None
+        self.data = None
+        self.starting_address = None
+        self._quantity = None
 
     @property
     def quantity(self):
@@ -665,12 +755,10 @@ class ReadHoldingRegisters(ModbusFunction):
         :param value: Quantity.
         :raises: IllegalDataValueError.
         """
-        if not (1 <= value <= 0x007D):
-            raise IllegalDataValueError('Quantify field of request must be a '
-                                        'value between 0 and '
-                                        '{0}.'.format(0x007D))
-
-        self._quantity = value
+        if 1 <= value <= 0x007D:
+            self._quantity = value
+        else:
+            raise IllegalDataValueError(_illegal_register_quantity_message)
 
     @property
     def request_pdu(self):
@@ -682,8 +770,8 @@ class ReadHoldingRegisters(ModbusFunction):
             # TODO Raise proper exception.
             raise Exception
 
-        return struct.pack('>BHH', self.function_code, self.starting_address,
-                           self.quantity)
+        return _request_pdu_struct.pack(self.function_code,
+                                        self.starting_address, self._quantity)
 
     @classmethod
     def create_from_request_pdu(cls, pdu):
@@ -692,7 +780,7 @@ class ReadHoldingRegisters(ModbusFunction):
         :param pdu: A request PDU.
         :return: Instance of this class.
         """
-        _, starting_address, quantity = struct.unpack('>BHH', pdu)
+        _, starting_address, quantity = _request_pdu_struct.unpack(pdu)
 
         instance = cls()
         instance.starting_address = starting_address
@@ -730,12 +818,34 @@ class ReadHoldingRegisters(ModbusFunction):
         :return: Instance of :class:`ReadCoils`.
         """
         read_holding_registers = cls()
-        read_holding_registers.quantity = struct.unpack('>H', req_pdu[-2:])[0]
-        read_holding_registers.byte_count = \
-            struct.unpack('>B', resp_pdu[1:2])[0]
+        # The quantity comes from the already validated request, assigning
+        # _quantity directly skips a second run of the setter's range check.
+        read_holding_registers._quantity = int.from_bytes(req_pdu[-2:], 'big')
+        read_holding_registers.byte_count = resp_pdu[1]
+
+        # A truncated response can hold fewer registers than requested; all
+        # tiers parse exactly the whole registers that are present.
+        count = min(read_holding_registers.quantity, (len(resp_pdu) - 2) // 2)
+
+        if _fastparse is not None:
+            read_holding_registers.data = _fastparse.unpack_registers(
+                resp_pdu[2:2 + read_holding_registers.byte_count],
+                count, conf.TYPE_CHAR == 'h')
 
-        fmt = '>' + (conf.TYPE_CHAR * read_holding_registers.quantity)
-        read_holding_registers.data = list(struct.unpack(fmt, resp_pdu[2:]))
+            return read_holding_registers
+
+        if np is not None:
+            # One vectorized byteswap over the payload instead of unpacking
+            # every register through struct.
+            read_holding_registers.data = np.frombuffer(
+                resp_pdu, dtype='>i2' if conf.TYPE_CHAR == 'h' else '>u2',
+                offset=2, count=count).tolist()
+
+            return read_holding_registers
+
+        fmt = '>' + (conf.TYPE_CHAR * count)
+        read_holding_registers.data = \
+            list(struct.unpack(fmt, resp_pdu[2:2 + (count * 2)]))
 
         return read_holding_registers
 
@@ -824,9 +934,13 @@ class ReadInputRegisters(ModbusFunction):
     function_code = READ_INPUT_REGISTERS
     max_quantity = 0x007D
 
-    data = None
-    starting_address = None
-    _quantity = None
+    __slots__ = ('byte_count', 'data', 'starting_address', '_quantity')
+
+    def __init__(self):
+        self.byte_count = None
+        self.data = None
+        self.starting_address = None
+        self._quantity = None
 
     @property
     def quantity(self):
@@ -840,12 +954,10 @@ class ReadInputRegisters(ModbusFunction):
         :param value: Quantity.
         :raises: IllegalDataValueError.
         """
-        if not (1 <= value <= 0x007D):
-            raise IllegalDataValueError('Quantify field of request must be a '
-                                        'value between 0 and '
-                                        '{0}.'.format(0x007D))
-
-        self._quantity = value
+        if 1 <= value <= 0x007D:
+            self._quantity = value
+        else:
+            raise IllegalDataValueError(_illegal_register_quantity_message)
 
     @property
     def request_pdu(self):
@@ -857,8 +969,8 @@ class ReadInputRegisters(ModbusFunction):
             # TODO Raise proper exception.
             raise Exception
 
-        return struct.pack('>BHH', self.function_code, self.starting_address,
-                           self.quantity)
+        return _request_pdu_struct.pack(self.function_code,
+                                        self.starting_address, self._quantity)
 
     @classmethod
     def create_from_request_pdu(cls, pdu):
@@ -867,7 +979,7 @@ class ReadInputRegisters(ModbusFunction):
         :param pdu: A request PDU.
         :return: Instance of this class.
         """
-        _, starting_address, quantity = struct.unpack('>BHH', pdu)
+        _, starting_address, quantity = _request_pdu_struct.unpack(pdu)
 
         instance = cls()
         instance.starting_address = starting_address
@@ -905,10 +1017,34 @@ class ReadInputRegisters(ModbusFunction):
         :return: Instance of :class:`ReadCoils`.
         """
         read_input_registers = cls()
-        read_input_registers.quantity = struct.unpack('>H', req_pdu[-2:])[0]
+        # The quantity comes from the already validated request, assigning
+        # _quantity directly skips a second run of the setter's range check.
+        read_input_registers._quantity = int.from_bytes(req_pdu[-2:], 'big')
+        read_input_registers.byte_count = resp_pdu[1]
+
+        # A truncated response can hold fewer registers than requested; all
+        # tiers parse exactly the whole registers that are present.
+        count = min(read_input_registers.quantity, (len(resp_pdu) - 2) // 2)
+
+        if _fastparse is not None:
+            read_input_registers.data = _fastparse.unpack_registers(
+                resp_pdu[2:2 + read_input_registers.byte_count],
+                count, conf.TYPE_CHAR == 'h')
 
-        fmt = '>' + (conf.TYPE_CHAR * read_input_registers.quantity)
-        read_input_registers.data = list(struct.unpack(fmt, resp_pdu[2:]))
+            return read_input_registers
+
+        if np is not None:
+            # One vectorized byteswap over the payload instead of unpacking
+            # every register through struct.
+            read_input_registers.data = np.frombuffer(
+                resp_pdu, dtype='>i2' if conf.TYPE_CHAR == 'h' else '>u2',
+                offset=2, count=count).tolist()
+
+            return read_input_registers
+
+        fmt = '>' + (conf.TYPE_CHAR * count)
+        read_input_registers.data = \
+            list(struct.unpack(fmt, resp_pdu[2:2 + (count * 2)]))
 
         return read_input_registers
 
@@ -992,9 +1128,12 @@ class WriteSingleCoil(ModbusFunction):
     function_code = WRITE_SINGLE_COIL
     format_character = 'B'
 
-    address = None
-    data = None
-    _value = None
+    __slots__ = ('address', 'data', '_value')
+
+    def __init__(self):
+        self.address = None
+        self.data = None
+        self._value = None
 
     @property
     def value(self):
@@ -1021,8 +1160,8 @@ class WriteSingleCoil(ModbusFunction):
             # TODO Raise proper exception.
             raise Exception
 
-        return struct.pack('>BHH', self.function_code, self.address,
-                           self._value)
+        return _request_pdu_struct.pack(self.function_code, self.address,
+                                        self._value)
 
     @classmethod
     def create_from_request_pdu(cls, pdu):
@@ -1031,7 +1170,7 @@ class WriteSingleCoil(ModbusFunction):
         :param pdu: A response PDU.
         :return: Instance of this class.
         """
-        _, address, value = struct.unpack('>BHH', pdu)
+        _, address, value = _request_pdu_struct.unpack(pdu)
 
         value = 1 if value == 0xFF00 else value
 
@@ -1138,9 +1277,12 @@ class WriteSingleRegister(ModbusFunction):
     """
     function_code = WRITE_SINGLE_REGISTER
 
-    address = None
-    data = None
-    _value = None
+    __slots__ = ('address', 'data', '_value')
+
+    def __init__(self):
+        self.address = None
+        self.data = None
+        self._value = None
 
     @property
     def value(self):
@@ -1287,9 +1429,13 @@ class WriteMultipleCoils(ModbusFunction):
     """
     function_code = WRITE_MULTIPLE_COILS
 
-    starting_address = None
-    _values = None
-    _data = None
+    __slots__ = ('data', 'quantity', 'starting_address', '_values')
+
+    def __init__(self):
+        self.data = None
+        self.quantity = None
+        self.starting_address = None
+        self._values = None
 
     @property
     def values(self):
@@ -1382,15 +1528,17 @@ class WriteMultipleCoils(ModbusFunction):
         fmt = '>' + (conf.SINGLE_BIT_VALUE_FORMAT_CHARACTER * byte_count)
         values = struct.unpack(fmt, pdu[6:])
 
-        res = list()
+        # The number of status values is known up front, so the list is
+        # allocated once at its final size instead of being grown per byte.
+        res = [0] * quantity
 
         for i, value in enumerate(values):
             padding = 8 if (quantity - (8 * i)) // 8 > 0 else quantity % 8
-            fmt = '{{0:0{padding}b}}'.format(padding=padding)
+            base = 8 * i
 
-            # Create binary representation of integer, convert it to a list
-            # and reverse the list.
-            res = res + [int(i) for i in fmt.format(value)][::-1]
+            # The LSB of the byte is the status of the first coil.
+            for k in range(padding):
+                res[base + k] = (value >> k) & 1
 
         instance = cls()
         instance.starting_address = starting_address
@@ -1497,9 +1645,12 @@ class WriteMultipleRegisters(ModbusFunction):
     """
     function_code = WRITE_MULTIPLE_REGISTERS
 
-    starting_address = None
-    _values = None
-    _data = None
+    __slots__ = ('data', 'starting_address', '_values')
+
+    def __init__(self):
+        self.data = None
+        self.starting_address = None
+        self._values = None
 
     @property
     def values(self):
@@ -1601,3 +1752,21 @@ function_code_to_function_map = {
     WRITE_MULTIPLE_COILS: WriteMultipleCoils,
     WRITE_MULTIPLE_REGISTERS: WriteMultipleRegisters,
 }
+
+# A function code fits in a single byte, so response dispatch doesn't need
+# the hashing of a dict lookup. The map above is flattened into a table
+# indexed by function code. Exception responses set the MSB of the function
+# code, hence 256 entries instead of 128.
+_function_code_to_function_table = \
+    [function_code_to_function_map.get(function_code)
+     for function_code in range(256)]
+
+# Response parsers are resolved once at import time: the bound
+# create_from_response_pdu reference and whether it takes the request PDU.
+# Resolving these per response would cost an attribute lookup and an inspect
+# call on the hot path.
+_response_pdu_parser_table = \
+    [(function.create_from_response_pdu,
+      'req_pdu' in getfullargspec(function.create_from_response_pdu).args)
+     if function is not None else None
+     for function in _function_code_to_function_table]
@@ -97,7 +97,7 @@ def get_function_code_from_request_pdu(pdu):
     :return pdu: Array with bytes.
     :return: Function code.
     """
-    return struct.unpack('>B', pdu[:1])[0]
+    return pdu[0]
 
 
 def memoize(f):